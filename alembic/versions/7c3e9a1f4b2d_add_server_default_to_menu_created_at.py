@@ -0,0 +1,41 @@
+"""Add server default to menu created_at
+
+Revision ID: 7c3e9a1f4b2d
+Revises: 1df86f1badd5
+Create Date: 2026-10-15 09:12:40.214305
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c3e9a1f4b2d'
+down_revision: Union[str, Sequence[str], None] = '1df86f1badd5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # SQLite cannot change a column default in place, batch mode rebuilds the table
+    with op.batch_alter_table('menu') as batch_op:
+        batch_op.alter_column(
+            'created_at',
+            existing_type=sa.String(),
+            existing_nullable=False,
+            server_default=sa.text('(CURRENT_TIMESTAMP)'),
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('menu') as batch_op:
+        batch_op.alter_column(
+            'created_at',
+            existing_type=sa.String(),
+            existing_nullable=False,
+            server_default=None,
+        )
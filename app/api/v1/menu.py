@@ -1,5 +1,5 @@
-from fastapi import APIRouter, Depends, HTTPException, Request
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import ORJSONResponse
 
 # Exceptions 
 from app.services.menu_service import MenuNotFoundException
@@ -11,7 +11,7 @@ from app.db.sessions import get_session
 
 # Helpers
 from app.helpers.convert_date_to_str import convert_datetime_to_str
-from datetime import datetime 
+from datetime import datetime, timezone
 
 # Schemas
 from app.schemas.menu_schemas import MenuBaseSchema, MenuCreateSchema, MenuResponseSchma, MenuUpdateSchema
@@ -20,35 +20,55 @@ from sqlmodel import Session
 
 menu_router = APIRouter()
 
+async def get_menu_service(db: Session = Depends(get_session)) -> MenuService:
+    """
+    Info: Builds the MenuService for the current request
+    Returns: MenuService bound to the request's session
+    """
+    return MenuService(db)
+
 @menu_router.get("/menus")
-async def get_all_menus(db = Depends(get_session)):
+def get_all_menus(summary: bool = False, service: MenuService = Depends(get_menu_service)):
     """
     Info: Get all Menus
+    Params:
+        - summary: bool (query) - skip dishes and return MenuSummarySchema items
     Returns: List of Menus 
     Return Type: list of MenuBaseSchema
     Errors: Raises HTTPException 500 if database query fails
     """
     try:
-        service = MenuService(db)
-        menus: List[MenuBaseSchema] = service.get_all_menus()
+        menus: List[MenuBaseSchema] = service.get_all_menus(summary=summary)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
-    return JSONResponse(content={"menus": menus}, status_code=200)
+    return ORJSONResponse(content={"menus": menus}, status_code=200)
 
 @menu_router.post("/create/menu")
-async def create_menu(req: Request, db = Depends(get_session)):
+def create_menu(menu: MenuCreateSchema, service: MenuService = Depends(get_menu_service)):
     try: 
-        # Retreive menu data from request body
-        menu_data = await req.json()
-        menu = MenuCreateSchema(**menu_data)
-        service = MenuService(db)
         resp: Dict[MenuResponseSchma] = service.create_menu(menu)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
-    return JSONResponse(content={"menu": resp}, status_code=201)
+    return ORJSONResponse(content={"menu": resp}, status_code=201)
+
+@menu_router.post("/create/menus")
+def create_menus(menus: List[MenuCreateSchema], service: MenuService = Depends(get_menu_service)):
+    """
+    Info: Create several Menus in one transaction
+    Params:
+        - menus: list of MenuCreateSchema
+    Returns: List of created Menus
+    Return Type: list of MenuResponseSchma
+    Errors: Raises HTTPException 500 if database operation fails
+    """
+    try:
+        resp: List[MenuResponseSchma] = service.create_menus(menus)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+    return ORJSONResponse(content={"menus": resp}, status_code=201)
 
 @menu_router.delete("/delete/menu/{menu_id}")
-async def delete_menu(menu_id: str, db = Depends(get_session)):
+def delete_menu(menu_id: str, service: MenuService = Depends(get_menu_service)):
     """
     Info: Delete a Menu by menu_id
     Params: 
@@ -58,22 +78,21 @@ async def delete_menu(menu_id: str, db = Depends(get_session)):
     Errors: Raises HTTPException 500 if database operation fails and 404 if menu is not found
     """
     try:
-        service = MenuService(db)
         service.delete_menu(menu_id)
         
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
-    
     except MenuNotFoundException as mnfe:
         raise HTTPException(status_code=404, detail=str(mnfe))
     
-    return JSONResponse(content={"message": "Menu deleted successfully"}, status_code=200)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+    
+    return ORJSONResponse(content={"message": "Menu deleted successfully"}, status_code=200)
 
 @menu_router.put("/update/menu/{menu_id}")
-async def update_menu(
-    req: Request,
+def update_menu(
     menu_id: str,
-    db: Session = Depends(get_session)
+    menu_update: MenuUpdateSchema,
+    service: MenuService = Depends(get_menu_service)
 ):
     """
     Info: Update a Menu by menu_id with provided data.
@@ -87,15 +106,11 @@ async def update_menu(
         - 500 for DB errors
     """
     try:
-        menu_data: MenuUpdateSchema= await req.json()
-        
-        if menu_data is None:
-            raise HTTPException(status_code=400, detail="No update data provided")
-        
-        updated_menu = MenuUpdateSchema(**menu_data, updated_at=convert_datetime_to_str(datetime.utcnow()))
+        # Only the fields sent by the client are applied
+        update_data = menu_update.model_dump(exclude_unset=True)
+        update_data["updated_at"] = convert_datetime_to_str(datetime.now(timezone.utc))
         
-        service = MenuService(db)
-        updated_menu = service.update_menu(menu_id, updated_menu.dict())
+        updated_menu = service.update_menu(menu_id, update_data)
         return updated_menu
 
     except MenuNotFoundException as mnfe:
@@ -1,5 +1,5 @@
 from fastapi import APIRouter, Depends, HTTPException, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
 # Schemas 
 from app.schemas.order_schemas import OrderBaseSchema, OrderCreateSchema
@@ -13,25 +13,25 @@ from app.services.order_service import OrderService
 
 
 order_router = APIRouter()
-@order_router.get("/orders")
-def get_all_orders(db: Session = Depends(get_session)):
+
+async def get_order_service(db: Session = Depends(get_session)) -> OrderService:
     """
-    Docstring for get_all_orders
+    Info: Builds the OrderService for the current request
+    Returns: OrderService bound to the request's session
     """
-    pass
+    return OrderService(db)
 
 @order_router.post("/create/order")
 def create_order(
     order: OrderCreateSchema,
-    db: Session = Depends(get_session))-> JSONResponse: 
+    service: OrderService = Depends(get_order_service))-> ORJSONResponse: 
     """
     Docstring for create_order
     """
     try: 
-        service = OrderService(db)
         resp: OrderBaseSchema = service.create_order(order)
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-    return JSONResponse(content={"order": resp}, status_code=201)
\ No newline at end of file
+    return ORJSONResponse(content={"order": resp}, status_code=201)
\ No newline at end of file
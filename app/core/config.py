@@ -1,3 +1,12 @@
 from pydantic_settings import BaseSettings
 class Config(BaseSettings): 
-    pass # 
\ No newline at end of file
+    database_url: str = "sqlite:///database.db"
+    database_echo: bool = False
+    db_pool_size: int = 20
+    db_max_overflow: int = 10
+    db_pool_timeout: int = 30
+    db_pool_recycle: int = 1800
+    db_pool_use_lifo: bool = True
+    menu_list_cache_ttl: int = 30
+
+settings = Config()
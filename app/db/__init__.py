@@ -1,5 +1,15 @@
+from contextlib import ExitStack
 from .sessions import engine
+from app.core.config import settings
 from sqlmodel import SQLModel
+from sqlalchemy import text
 
 def create_all_db_tables():
-    SQLModel.metadata.create_all(engine)
\ No newline at end of file
+    SQLModel.metadata.create_all(engine)
+
+def warm_up_db_pool():
+    # Hold pool_size connections at once so the pool opens all of them before the first request
+    with ExitStack() as stack:
+        for _ in range(settings.db_pool_size):
+            conn = stack.enter_context(engine.connect())
+            conn.execute(text("SELECT 1"))
@@ -1,8 +1,20 @@
 from sqlmodel import create_engine, Session
+from app.core.config import settings
 
-engine = create_engine("sqlite:///database.db")
+engine = create_engine(
+    settings.database_url,
+    echo=settings.database_echo,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_timeout=settings.db_pool_timeout,
+    pool_recycle=settings.db_pool_recycle,
+    pool_use_lifo=settings.db_pool_use_lifo,
+    pool_pre_ping=True,
+)
 
 def get_session():
-    with Session(engine) as session:
+    # Committed objects stay loaded, create_menu gets created_at back through
+    # eager_defaults (INSERT ... RETURNING) and no other service reloads after commit
+    with Session(engine, expire_on_commit=False) as session:
         yield session
 
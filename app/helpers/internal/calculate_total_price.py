@@ -1,13 +1,72 @@
+import logging
+from functools import lru_cache
+import numpy as np
 from app.schemas.order_schemas import OrderItemSchema
 
-def calculate_total_price(orders: list[OrderItemSchema]) -> float:
+logger = logging.getLogger(__name__)
+
+# Smaller carts are cheaper to total than to hash, so they skip the memo
+MEMOIZE_MIN_ITEMS = 4
+# Copying a cart into arrays costs more than the loop below roughly 4-5k items
+ARRAY_MIN_ITEMS = 4096
+
+def _total_price_loop(items) -> float:
     total_price = 0.0
-    print("Calculating total price for orders:", orders)
-    for order_item in orders:
-        item_price = order_item['item_price']
-        item_quantity = order_item['item_quantity']
-        item_discount = order_item['item_discount'] or 0.0
+    for item_price, item_quantity, item_discount in items:
         discounted_price = item_price * (1 - item_discount / 100)
         line_total = discounted_price * item_quantity
         total_price += line_total
+    return total_price
+
+def _total_price_np(prices, quantities, discounts):
+    # Same per-line arithmetic as the loop, and a running sum in item order
+    # (np.sum/np.dot sum pairwise, which can move the rounded total by a cent)
+    line_totals = prices * (1 - discounts / 100) * quantities
+    return float(np.add.accumulate(line_totals)[-1])
+
+@lru_cache(maxsize=None)
+def _numba_total_price():
+    # numba is imported on the first array-sized cart, not at app start,
+    # so ordinary carts never pay for the import or the JIT compile
+    try:
+        from numba import njit
+    except ImportError:
+        return None
+
+    @njit(cache=True)
+    def _total_price_nb(prices, quantities, discounts):
+        # Single fused loop, no temporary array for the discounted prices
+        total = 0.0
+        for i in range(prices.shape[0]):
+            total += prices[i] * (1 - discounts[i] / 100) * quantities[i]
+        return total
+
+    return _total_price_nb
+
+def _compute_total_price(items: tuple) -> float:
+    count = len(items)
+    if count < ARRAY_MIN_ITEMS:
+        return round(_total_price_loop(items), 2)
+    # Unpack the (price, quantity, discount) rows into parallel arrays and total them in one pass
+    prices = np.fromiter((item[0] for item in items), dtype=np.float64, count=count)
+    quantities = np.fromiter((item[1] for item in items), dtype=np.int64, count=count)
+    discounts = np.fromiter((item[2] for item in items), dtype=np.float64, count=count)
+    total_price_nb = _numba_total_price()
+    if total_price_nb is not None:
+        total_price = float(total_price_nb(prices, quantities, discounts))
+    else:
+        total_price = _total_price_np(prices, quantities, discounts)
     return round(total_price, 2)
+
+# Totals are a pure function of the item rows, so repeated carts are a dict probe
+_cached_total_price = lru_cache(maxsize=4096)(_compute_total_price)
+
+def calculate_total_price(orders: list[OrderItemSchema]) -> float:
+    logger.debug("calculating total price for %d items", len(orders))
+    items = tuple(
+        (o['item_price'], o['item_quantity'], d if (d := o.get('item_discount')) is not None else 0.0)
+        for o in orders
+    )
+    if len(items) < MEMOIZE_MIN_ITEMS:
+        return _compute_total_price(items)
+    return _cached_total_price(items)
@@ -1,11 +1,7 @@
 from sqlmodel import SQLModel, Field
-from sqlalchemy import JSON
-from datetime import datetime
+from sqlalchemy import JSON, text
 from typing import List, Optional
 
-# Helpers
-from app.helpers.convert_date_to_str import convert_datetime_to_str
-
 class DishBaseSchema(SQLModel):
     dish_name: str
     dish_description: str
@@ -21,7 +17,7 @@ class Menu(SQLModel, table=True):
     menu_title: str
     restaurant_id: str
     menu_description: Optional[str] = Field(default="", max_length=500)
-    created_at: str = convert_datetime_to_str(datetime.utcnow())
+    created_at: Optional[str] = server default CURRENT_TIMESTAMP
     dishes: List[DishBaseSchema] 
 
     """
@@ -29,10 +25,18 @@ class Menu(SQLModel, table=True):
     menu_title: str
     menu_description: str = Field(min_length=0, max_length=500)
     restaurant_id: str 
-    created_at: str = Field(default=convert_datetime_to_str(datetime.utcnow()), index=True)
+    # Stamped by the database on INSERT
+    created_at: Optional[str] = Field(
+        default=None,
+        index=True,
+        nullable=False,
+        sa_column_kwargs={"server_default": text("CURRENT_TIMESTAMP")},
+    )
     updated_at: Optional[str] = Field(default=None, index=True)
     dishes: List[DishBaseSchema] = Field(default_factory=list, sa_type=JSON)
-    created_at: str = Field(default=convert_datetime_to_str(datetime.utcnow()), index=True)
+
+    # Read server defaults back with RETURNING on INSERT instead of a later SELECT
+    __mapper_args__ = {"eager_defaults": True}
 
 
 
@@ -2,7 +2,7 @@ from sqlmodel import SQLModel, Field, Column, JSON
 from enum import Enum
 from typing import Optional, Dict, List
 from pydantic import model_validator
-from datetime import datetime
+from datetime import datetime, timezone
 
 # Helpers
 from app.helpers.convert_date_to_str import convert_datetime_to_str
@@ -49,7 +49,7 @@ class Order(SQLModel, table=True):
             if not self.otp:
                 raise ValueError("otp must be set when order is approved")
             if self.approved_at is None:
-                self.approved_at = convert_datetime_to_str(datetime.utcnow())
+                self.approved_at = convert_datetime_to_str(datetime.now(timezone.utc))
         else:
             self.otp = None
             self.approved_at = None
@@ -17,6 +17,14 @@ class MenuBaseSchema(BaseModel):
     restaurant_id: str # TODO: Change to UUID in future
     created_at:str
 
+class MenuSummarySchema(BaseModel):
+    menu_id: str
+    menu_title: str
+    menu_description: str
+    restaurant_id: str # TODO: Change to UUID in future
+    created_at: str
+    updated_at: Optional[str] = None
+
 class MenuCreateSchema(BaseModel):
     menu_title: str
     menu_description: str
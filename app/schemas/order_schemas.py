@@ -1,10 +1,10 @@
-from pydantic import BaseModel
-from typing import List, Optional, Dict 
+from pydantic import BaseModel, Field
+from typing import Annotated, List, Optional, Dict 
 
 class OrderItemSchema(BaseModel):
     item_name: str
-    item_quantity: int 
-    item_price: float 
+    item_quantity: Annotated[int, Field(gt=0)]
+    item_price: Annotated[float, Field(gt=0)]
     item_discount: Optional[float] = 0.0
 
 class RestaurantSchema(BaseModel):
@@ -35,7 +35,7 @@ class OrderBaseSchema(BaseModel):
     user: UserSchema
 
 class OrderCreateSchema(BaseModel):
-    orders: List[OrderItemSchema]
+    orders: Annotated[List[OrderItemSchema], Field(min_length=1)]
     restaurant: RestaurantSchema
     user: UserSchema
     
\ No newline at end of file
@@ -1,8 +1,9 @@
-from datetime import datetime
+from threading import Lock
 from uuid import uuid4
-from app.repos.menus import menu
+from cachetools import TTLCache
+from app.core.config import settings
 from app.repos.menus.menu import Menu
-from sqlmodel import select
+from sqlmodel import select, update
 
 # Exceptions 
 class MenuNotFoundException(Exception):
@@ -14,23 +15,63 @@ class MenuNotFoundException(Exception):
 from app.schemas.menu_schemas import MenuBaseSchema
 from typing import List
 
+# Columns backing MenuSummarySchema, leaves out the dishes JSON blob
+MENU_SUMMARY_COLUMNS = (
+    Menu.menu_id,
+    Menu.menu_title,
+    Menu.menu_description,
+    Menu.restaurant_id,
+    Menu.created_at,
+    Menu.updated_at,
+)
+
+# Listing statements are built once and reused for every call
+_ALL_MENUS_STMT = select(*Menu.__table__.c)
+_MENU_SUMMARY_STMT = select(*MENU_SUMMARY_COLUMNS)
+
+# Menu listings keyed by the summary flag, cleared on every menu write
+_menu_list_cache = TTLCache(maxsize=2, ttl=settings.menu_list_cache_ttl)
+_menu_list_cache_lock = Lock()
+# Bumped on every invalidation, a listing read before a write is never cached after it
+_menu_list_cache_generation = 0
+
+def invalidate_menu_list_cache():
+    global _menu_list_cache_generation
+    with _menu_list_cache_lock:
+        _menu_list_cache_generation += 1
+        _menu_list_cache.clear()
+
 class MenuService(): 
     def __init__(self, db):
         self.db = db
     
-    def get_all_menus(self):
+    def get_all_menus(self, summary: bool = False):
         """
         Docstring for get_all_menus
         
-        :Returns: List of MenuBaseSchema
+        :param summary: bool - only select the MenuSummarySchema columns, skipping dishes
+        :Returns: List of MenuBaseSchema, or MenuSummarySchema if summary is set
         :rtype: list of MenuBaseSchema
         :errors: Raises Exception of datbase query fails
         """
+        with _menu_list_cache_lock:
+            cached = _menu_list_cache.get(summary)
+            generation = _menu_list_cache_generation
+        if cached is not None:
+            return cached
         try:
-            menus = self.db.exec(select(Menu)).all()
-            menus_dict = [menu.model_dump() for menu in menus] 
+            if summary:
+                rows = self.db.exec(_MENU_SUMMARY_STMT).all()
+                menus_dict = [row._asdict() for row in rows]
+            else:
+                # Plain column rows, no Menu instances to hydrate and dump again
+                rows = self.db.exec(_ALL_MENUS_STMT).mappings().all()
+                menus_dict = [dict(row) for row in rows]
         except Exception as e:
             raise e
+        with _menu_list_cache_lock:
+            if generation == _menu_list_cache_generation:
+                _menu_list_cache[summary] = menus_dict
         return menus_dict
     
     def create_menu(self, menu):
@@ -45,15 +86,35 @@ class MenuService():
         try:
             db_menu = Menu(
                 menu_id=str(uuid4()),
-                created_at=datetime.utcnow(),
                 **menu.dict())
             self.db.add(db_menu)
             self.db.commit()
-            self.db.refresh(db_menu)
+            invalidate_menu_list_cache()
         except Exception as e:
             raise e
         return db_menu.model_dump()
     
+    def create_menus(self, menus):
+        """
+        Docstring for create_menus
+
+        :param menus: list of MenuCreateSchema
+        :returns: Created Menus as list of dict
+        :rtype: list of dict
+        :errors: Raises Exception if database operation fails
+        """
+        try:
+            db_menus = [Menu(menu_id=str(uuid4()), **menu.model_dump()) for menu in menus]
+            self.db.add_all(db_menus)
+            # Ids are set client side and the flush RETURNs created_at, so no per-row refresh
+            self.db.flush()
+            menus_dict = [db_menu.model_dump() for db_menu in db_menus]
+            self.db.commit()
+            invalidate_menu_list_cache()
+        except Exception as e:
+            raise e
+        return menus_dict
+    
     def delete_menu(self, menu_id: str):
         """
         Docstring for delete_menu
@@ -69,6 +130,7 @@ class MenuService():
                 raise MenuNotFoundException(menu_id=menu_id)
             self.db.delete(menu)
             self.db.commit()
+            invalidate_menu_list_cache()
         except Exception as e:
             raise e
         
@@ -83,17 +145,20 @@ class MenuService():
         :raises Exception: for other DB errors
         """
         try:
-            menu = self.db.get(Menu, menu_id)
+            # Single UPDATE ... RETURNING instead of SELECT, UPDATE and refresh
+            stmt = (
+                update(Menu)
+                .where(Menu.menu_id == menu_id)
+                .values(**update_data)
+                .returning(Menu)
+            )
+            menu = self.db.exec(stmt).scalar_one_or_none()
             
             if not menu:
                 raise MenuNotFoundException(menu_id=menu_id)
 
-            for key, value in update_data.items():
-                setattr(menu, key, value)
-
-            self.db.add(menu)
             self.db.commit()
-            self.db.refresh(menu)
+            invalidate_menu_list_cache()
 
         except Exception as e:
             raise e
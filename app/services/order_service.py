@@ -1,4 +1,4 @@
-from datetime import datetime
+import logging
 from uuid import uuid4
 
 # Repos
@@ -8,6 +8,8 @@ from sqlmodel import select
 # Helpers
 from app.helpers.internal.calculate_total_price import calculate_total_price
 
+logger = logging.getLogger(__name__)
+
 class OrderService(): 
     def __init__(self, db):
         self.db = db
@@ -19,19 +21,20 @@ class OrderService():
         :param order: OrderCreateSchema
         """
         try:
-            order_dict = order.model_dump(exclude_unset=True)
-            print("Order Dict:", order_dict)
+            # Dump to JSON-ready data once, items are stored in the `order` JSON column
+            order_dict = order.model_dump(mode="json")
+            logger.debug("order dict: %s", order_dict)
 
             total_price  = calculate_total_price(order_dict['orders'])
 
             order_db = Order(
                 order_id = str(uuid4()),
                 total_price= total_price,
-                created_at = datetime.utcnow(),**order.model_dump())
+                order=order_dict.pop('orders'),
+                **order_dict)
 
             self.db.add(order_db)
             self.db.commit()
-            self.db.refresh(order_db)
 
         except Exception as e:
             raise e  
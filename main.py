@@ -1,27 +1,38 @@
+import logging
 import uvicorn
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
-from app.db import create_all_db_tables
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
+from app.db import create_all_db_tables, warm_up_db_pool
 from app.api.v1.menu import menu_router
 from app.api.v1.order import order_router
 
+# uvicorn configures its own loggers only, an unconfigured "main" logger would drop INFO
+logger = logging.getLogger("uvicorn.error")
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup
     create_all_db_tables()
-    print("✓ Database tables created successfully")
+    logger.info("Database tables created successfully")
+    warm_up_db_pool()
     yield
     # Shutdown
-    print("✓ App shutting down")
+    logger.info("App shutting down")
 
 
 app = FastAPI(
     title="Lunchify_2.0",
     summary="A Food Delivery app, Mainly a practice app",
     version="v1",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
+# Compress larger payloads such as the menu listing
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=4)
+
 app.include_router(
     prefix="/api/v1/menus", 
     router=menu_router